@@ -1,7 +1,9 @@
 import tkinter as tk
-import random
 import os
 import sys
+import threading
+from joke_index import load_or_build_index, index_path_for
+import joke_client
 
 # --- custom styling ---
 color_theme = {
@@ -15,16 +17,38 @@ color_theme = {
     'font_size_button': 12,
 }
 
+# --- joke file loading ---
+joke_file_name = "randomJokes.txt"
+
+def read_joke_file():
+    """reads the joke file next to the script; returns (joke data, index cache path)."""
+    # safer pathing: look for the file relative to the script's own directory
+    try:
+        script_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+        file_path = os.path.join(script_dir, joke_file_name)
+        
+        with open(file_path, 'r') as f:
+            return f.read(), index_path_for(file_path)
+            
+    except FileNotFoundError:
+        print(f"error: '{joke_file_name}' not found. please ensure the file is in the script's directory.")
+        # provide a fallback message for the app ui
+        return "file not found?sorry, i can't find my joke book.", None
+    except Exception as e:
+        print(f"an unexpected error occurred while reading the file: {e}")
+        return "read error?something went wrong reading the file.", None
+
 # --- main application class ---
 class jokeassistantapp:
     # constructor sets up the app state and the main window
-    def __init__(self, master, joke_file_content):
+    def __init__(self, master, joke_file_content=None, index_cache_path=None, service=None):
         self.master = master
         self.master.title("alexa tell me a joke")
-        self.master.geometry("550x300")
+        self.master.geometry("550x360")
         self.master.configure(bg=color_theme['background'])
 
-        self.jokes = self.load_jokes(joke_file_content)
+        # a running joke service shares one parsed corpus; otherwise load it in-process
+        self.source = service
         self.current_joke_parts = (None, None)
         
         # main content frame
@@ -32,22 +56,47 @@ class jokeassistantapp:
         self.main_frame.pack(pady=20, padx=20, fill='both', expand=True)
 
         self.setup_ui()
+        if self.source is None: self.start_index_build(joke_file_content, index_cache_path)
+        else: self.display_welcome()
+
+    def load_jokes(self, content=None, cache_path=None):
+        """builds (or reloads from cache) the de-duplicated keyword index of (setup, punchline) jokes."""
+        if content is None: content, cache_path = read_joke_file()
+        return load_or_build_index(content, cache_path)
+
+    def start_index_build(self, content, cache_path):
+        """loads the jokes on a worker thread so the window appears (and stays responsive) during a slow first build."""
+        self.setup_label.config(text="building joke index...")
+        self.punchline_label.config(text="this only takes a while when the joke file has changed.")
+        for button in (self.tell_joke_btn, self.punchline_btn, self.next_joke_btn, self.search_btn): button.config(state=tk.DISABLED)
+
+        result = {}
+        worker = threading.Thread(target=lambda: result.update(index=self.load_jokes(content, cache_path)), daemon=True)
+        worker.start()
+        self.master.after(50, self.finish_index_build, worker, result)
+
+    def finish_index_build(self, worker, result):
+        """polls the worker from the tk thread (widgets must not be touched from the worker itself)."""
+        if worker.is_alive():
+            self.master.after(50, self.finish_index_build, worker, result)
+            return
+        self.source = result.get('index') or load_or_build_index("")
+        self.tell_joke_btn.config(state=tk.NORMAL)
+        self.search_btn.config(state=tk.NORMAL)
         self.display_welcome()
 
-    def load_jokes(self, content):
-        """reads joke data and splits them into a list of (setup, punchline) tuples."""
-        jokes_list = []
-        for line in content.strip().split('\n'):
-            if '?' in line:
-                try:
-                    # split the line exactly once at the first '?'
-                    setup, punchline = line.split('?', 1)
-                    # clean up and store
-                    jokes_list.append((setup.strip(), punchline.strip()))
-                except ValueError:
-                    # handle lines without content after the separator
-                    continue
-        return jokes_list
+    def fetch_joke(self, topic=None):
+        """asks the joke source for a random joke (about topic, if given); None if there is none."""
+        try:
+            return self.source.joke_about(topic) if topic else self.source.random_joke()
+        except (OSError, ValueError):
+            # the shared service went away, so fall back to loading the corpus in-process
+            try:
+                self.source.close()
+            except OSError:
+                pass
+            self.source = self.load_jokes()
+            return self.source.joke_about(topic) if topic else self.source.random_joke()
 
     def setup_ui(self):
         """initializes the ui elements."""
@@ -79,6 +128,15 @@ class jokeassistantapp:
         self.quit_btn = tk.Button(self.button_frame, text="quit", command=self.master.destroy, bg=color_theme['secondary'], fg=color_theme['background'], font=(color_theme['font_style'], color_theme['font_size_button']), padx=10)
         self.quit_btn.pack(side=tk.LEFT, padx=10)
 
+        # topic search row: "tell me a joke about x"
+        self.search_frame = tk.Frame(self.main_frame, bg=color_theme['background'])
+        self.search_frame.pack(pady=(5, 10))
+        self.search_entry = tk.Entry(self.search_frame, font=(color_theme['font_style'], color_theme['font_size_button']), width=25)
+        self.search_entry.pack(side=tk.LEFT, padx=10)
+        self.search_entry.bind('<Return>', lambda event: self.tell_joke_about())
+        self.search_btn = tk.Button(self.search_frame, text="tell me a joke about...", command=self.tell_joke_about, bg=color_theme['secondary'], fg=color_theme['background'], font=(color_theme['font_style'], color_theme['font_size_button']), padx=10)
+        self.search_btn.pack(side=tk.LEFT, padx=10)
+
     def display_welcome(self):
         """shows initial welcome message."""
         self.setup_label.config(text="welcome to the joke assistant!")
@@ -88,15 +146,37 @@ class jokeassistantapp:
 
     def tell_new_joke(self):
         """randomly selects and displays a new joke setup."""
-        if not self.jokes:
+        joke = self.fetch_joke()
+        if joke is None:
             self.setup_label.config(text="sorry, i ran out of jokes! ensure randomJokes.txt is in the correct directory.")
             self.punchline_label.config(text="")
             self.punchline_btn.config(state=tk.DISABLED)
             self.next_joke_btn.config(state=tk.DISABLED)
             return
 
-        # select random joke
-        self.current_joke_parts = random.choice(self.jokes)
+        self.present_joke(joke)
+
+    def tell_joke_about(self):
+        """picks a random joke matching the topic typed in the search box."""
+        if self.source is None: return  # still building the index; <Return> bypasses the disabled button
+        topic = self.search_entry.get().strip()
+        if not topic:
+            self.tell_new_joke()
+            return
+
+        joke = self.fetch_joke(topic)
+        if joke is None:
+            self.setup_label.config(text=f"sorry, i don't know any jokes about '{topic}'.")
+            self.punchline_label.config(text="")
+            self.punchline_btn.config(state=tk.DISABLED)
+            self.tell_joke_btn.config(state=tk.NORMAL)
+            return
+
+        self.present_joke(joke)
+
+    def present_joke(self, joke_parts):
+        """displays a joke setup and hides its punchline."""
+        self.current_joke_parts = joke_parts
         setup, _ = self.current_joke_parts
 
         # display setup, hide punchline
@@ -121,25 +201,11 @@ class jokeassistantapp:
 
 # --- run application ---
 if __name__ == '__main__':
-    joke_file_name = "randomJokes.txt"
-    joke_data = ""
-    
-    # safer pathing: look for the file relative to the script's own directory
-    try:
-        script_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
-        file_path = os.path.join(script_dir, joke_file_name)
-        
-        with open(file_path, 'r') as f:
-            joke_data = f.read()
-            
-    except filenotfounderror:
-        print(f"error: '{joke_file_name}' not found. please ensure the file is in the script's directory.")
-        # provide a fallback message for the app ui
-        joke_data = "file not found?sorry, i can't find my joke book."
-    except exception as e:
-        print(f"an unexpected error occurred while reading the file: {e}")
-        joke_data = "read error?something went wrong reading the file."
-
+    # prefer the shared local joke service; without it, read and index the file ourselves
+    service = joke_client.connect()
     root = tk.Tk()
-    app = jokeassistantapp(root, joke_data)
+    if service is not None:
+        app = jokeassistantapp(root, service=service)
+    else:
+        app = jokeassistantapp(root, *read_joke_file())
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,69 @@
+import json
+import os
+import socket
+import tempfile
+
+# --- configuration and constants ---
+# one line of json per request and per reply, e.g.
+#   {"op": "random"}                   -> {"joke": ["setup", "punchline"]}
+#   {"op": "about", "topic": "pizza"}  -> {"joke": null}
+# kept free of the server's asyncio/argparse imports so every tk window starts quickly.
+connect_timeout = 0.5
+socket_name = "joke_assistant.sock"
+
+def default_socket_path():
+    """$XDG_RUNTIME_DIR/joke_assistant.sock, or the same name in a private per-user directory under the temp dir."""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir and os.path.isdir(runtime_dir): return os.path.join(runtime_dir, socket_name)
+    user_id = os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', 'user')
+    return os.path.join(tempfile.gettempdir(), f"joke_assistant-{user_id}", socket_name)
+
+def owned_by_current_user(path):
+    """true if path exists and belongs to this user, so another local user can't plant a fake service."""
+    try:
+        info = os.stat(path)
+    except OSError:
+        return False
+    return not hasattr(os, 'getuid') or info.st_uid == os.getuid()
+
+
+# --- client: same random_joke/joke_about interface as the in-process index ---
+class jokeserviceclient:
+    def __init__(self, sock):
+        self.sock, self.reader = sock, sock.makefile('rb')
+
+    def _request(self, **request):
+        """sends one request and waits for its reply; raises OSError if the service is gone."""
+        self.sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        line = self.reader.readline()
+        if not line: raise ConnectionError("joke service closed the connection")
+        reply = json.loads(line)
+        if "error" in reply: raise ConnectionError(f"joke service error: {reply['error']}")
+        return reply
+
+    def random_joke(self):
+        joke = self._request(op="random")["joke"]
+        return tuple(joke) if joke else None
+
+    def joke_about(self, topic):
+        joke = self._request(op="about", topic=topic)["joke"]
+        return tuple(joke) if joke else None
+
+    def close(self):
+        self.reader.close(); self.sock.close()
+
+
+def connect(socket_path=None, timeout=connect_timeout):
+    """returns a client for the running joke service, or None if it is absent (or not ours)."""
+    if not hasattr(socket, 'AF_UNIX'): return None
+    socket_path = socket_path or default_socket_path()
+    if not owned_by_current_user(socket_path): return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(socket_path)
+        client = jokeserviceclient(sock)
+        client._request(op="ping")
+        return client
+    except (OSError, ValueError):
+        sock.close(); return None
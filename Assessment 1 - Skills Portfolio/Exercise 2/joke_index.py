@@ -0,0 +1,201 @@
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import tempfile
+
+# --- configuration and constants ---
+index_suffix = ".idx.json"
+index_version = 2
+near_duplicate_threshold = 0.8
+stop_words = frozenset("""
+a about after all am an and are as at be because but by can did do does for from get got had has have he her him his
+how i if in into is it its just me my no not of on or our out she so than that the their them then there they this to
+up was we were what when where which who why will with you your
+""".split())
+token_pattern = re.compile(r"[a-z0-9]+")
+
+
+# --- parsing and tokenising ---
+def parse_jokes(content):
+    """reads joke data and splits them into a list of (setup, punchline) tuples."""
+    jokes_list = []
+    for line in content.strip().split('\n'):
+        if '?' in line:
+            # split the line exactly once at the first '?'
+            setup, punchline = line.split('?', 1)
+            jokes_list.append((setup.strip(), punchline.strip()))
+    return jokes_list
+
+def _normalise(word):
+    """folds simple plurals so 'chickens' finds 'chicken'."""
+    if len(word) > 3 and word.endswith('s') and not word.endswith('ss'): return word[:-1]
+    return word
+
+def tokenize(text):
+    """lowercases text and returns its searchable (non stop word) tokens in order."""
+    return [_normalise(w) for w in token_pattern.findall(text.lower()) if w not in stop_words]
+
+def index_path_for(joke_file_path):
+    """the cache lives next to the joke file, e.g. randomJokes.txt.idx.json."""
+    return joke_file_path + index_suffix
+
+
+# --- duplicate detection ---
+def find_duplicates(jokes, threshold=near_duplicate_threshold):
+    """returns {dropped id: kept id} for exact and near-duplicate jokes.
+
+    exact duplicates have the same setup and punchline once case and whitespace are
+    ignored. near duplicates, among jokes with at least one content token, are
+    found with prefix filtering: tokens are ordered rarest first, and two sets with
+    jaccard >= threshold must share a token within each other's short prefix, so
+    only jokes meeting in a prefix posting list are ever compared. candidates are
+    further pruned by size (|y| >= t*|x|) and by counting prefix overlaps against
+    the overlap a match would need, before the one exact intersection check.
+    """
+    token_sets = [frozenset(tokenize(s + ' ' + p)) for s, p in jokes]
+    frequency = {}
+    for tokens in token_sets:
+        for t in tokens: frequency[t] = frequency.get(t, 0) + 1
+    # rank tokens rarest first so every joke becomes a short sorted list of ints
+    rank = {t: r for r, t in enumerate(sorted(frequency, key=lambda t: (frequency[t], t)))}
+    sizes = [len(tokens) for tokens in token_sets]
+    overlap_ratio = threshold / (1 + threshold)  # jaccard >= t  <=>  overlap >= t/(1+t) * (|x| + |y|)
+
+    duplicates, seen_exact, prefix_postings = {}, {}, {}
+    for joke_id, (setup, punchline) in enumerate(jokes):
+        exact_key = ' '.join(setup.lower().split()) + '?' + ' '.join(punchline.lower().split())
+        if exact_key in seen_exact:
+            duplicates[joke_id] = seen_exact[exact_key]; continue
+        seen_exact[exact_key] = joke_id
+
+        size = sizes[joke_id]
+        if not size: continue  # nothing but stop words: no basis for a similarity score
+        prefix = sorted(rank[t] for t in token_sets[joke_id])[:size - math.ceil(threshold * size) + 1]
+        min_size, max_size = threshold * size, size / threshold
+
+        # overlap seen so far in the prefixes, or -1 once a candidate can no longer reach the threshold
+        overlaps = {}
+        for position, t in enumerate(prefix):
+            remaining = size - position - 1
+            # postings are bucketed by joke size, so the size filter skips whole buckets
+            for other_size, entries in prefix_postings.get(t, {}).items():
+                if other_size < min_size or other_size > max_size: continue
+                needed = math.ceil(overlap_ratio * (size + other_size) - 1e-9)
+                for other, other_remaining in entries:
+                    seen = overlaps.get(other, 0)
+                    if seen < 0: continue
+                    best_possible = seen + 1 + (remaining if remaining < other_remaining else other_remaining)
+                    overlaps[other] = seen + 1 if best_possible >= needed else -1
+
+        tokens = token_sets[joke_id]
+        for other in sorted(o for o, seen in overlaps.items() if seen > 0):
+            overlap = len(tokens & token_sets[other])
+            if overlap >= threshold * (size + sizes[other] - overlap):
+                duplicates[joke_id] = other; break
+        else:
+            for position, t in enumerate(prefix):
+                prefix_postings.setdefault(t, {}).setdefault(size, []).append((joke_id, size - position - 1))
+    return duplicates
+
+
+# --- inverted index ---
+class jokeindex:
+    def __init__(self, jokes, postings, duplicates_dropped=0):
+        self.jokes, self.postings = jokes, postings
+        self.duplicates_dropped = duplicates_dropped
+
+    @classmethod
+    def build(cls, jokes):
+        """drops duplicates then maps every setup/punchline token to the ids of the jokes using it."""
+        duplicates = find_duplicates(jokes)
+        unique_jokes = [j for i, j in enumerate(jokes) if i not in duplicates]
+        postings = {}
+        for joke_id, (setup, punchline) in enumerate(unique_jokes):
+            for t in set(tokenize(setup + ' ' + punchline)): postings.setdefault(t, []).append(joke_id)
+        return cls(unique_jokes, postings, len(duplicates))
+
+    def search(self, query):
+        """returns ids of jokes about the query: all terms if possible, otherwise the best partial matches."""
+        terms = set(tokenize(query))
+        if not terms: return []
+        lists = sorted((self.postings.get(t, []) for t in terms), key=len)
+        if lists[0]:
+            # intersect starting from the shortest posting list
+            matches = set(lists[0])
+            for ids in lists[1:]:
+                matches.intersection_update(ids)
+                if not matches: break
+            if matches: return sorted(matches)
+        scores = {}
+        for ids in lists:
+            for joke_id in ids: scores[joke_id] = scores.get(joke_id, 0) + 1
+        if not scores: return []
+        best = max(scores.values())
+        return sorted(i for i, score in scores.items() if score == best)
+
+    def random_joke(self):
+        """returns a random (setup, punchline) pair, or None for an empty corpus."""
+        return random.choice(self.jokes) if self.jokes else None
+
+    def joke_about(self, topic):
+        """returns a random joke matching the topic, or None if nothing matches."""
+        matches = self.search(topic)
+        return self.jokes[random.choice(matches)] if matches else None
+
+    # --- disk cache ---
+    def save(self, path, source_digest):
+        """writes the cache atomically so windows starting together never see (or leave) a half-written file."""
+        data = {"version": index_version, "source": source_digest, "duplicates_dropped": self.duplicates_dropped,
+                "jokes": self.jokes, "postings": self.postings}
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f: json.dump(data, f, separators=(',', ':'))
+            os.chmod(temp_path, 0o644)  # mkstemp creates 0600; keep the cache readable like the joke file
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path); raise
+
+    @classmethod
+    def load(cls, path, source_digest):
+        """returns the cached index, or None if it is missing, unreadable or built from other content."""
+        try:
+            with open(path, 'r') as f: data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict): return None
+        if data.get("version") != index_version or data.get("source") != source_digest: return None
+        # right version and digest but the wrong shape means rebuilding, not crashing later in the gui
+        jokes, postings = data.get("jokes"), data.get("postings")
+        if not _is_joke_list(jokes) or not _is_postings(postings, len(jokes)): return None
+        duplicates_dropped = data.get("duplicates_dropped", 0)
+        if type(duplicates_dropped) is not int: return None
+        return cls([tuple(j) for j in jokes], postings, duplicates_dropped)
+
+
+def _is_joke_list(jokes):
+    """true for a list of [setup, punchline] string pairs."""
+    return isinstance(jokes, list) and all(
+        isinstance(j, list) and len(j) == 2 and all(isinstance(part, str) for part in j) for j in jokes)
+
+def _is_postings(postings, joke_count):
+    """true for a {token: [joke id, ...]} dict whose ids all point into the joke list."""
+    return isinstance(postings, dict) and all(
+        isinstance(ids, list) and all(type(i) is int and 0 <= i < joke_count for i in ids) for ids in postings.values())
+
+
+def load_or_build_index(content, cache_path=None):
+    """returns the index for the joke file content, reusing the on-disk cache when it is still current."""
+    digest = hashlib.sha1(content.encode('utf-8')).hexdigest()
+    if cache_path:
+        cached = jokeindex.load(cache_path, digest)
+        if cached is not None: return cached
+    index = jokeindex.build(parse_jokes(content))
+    if cache_path:
+        try:
+            index.save(cache_path, digest)
+        except OSError:
+            pass  # a read-only directory just means rebuilding next time
+    return index
@@ -0,0 +1,123 @@
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import stat
+import sys
+from joke_index import load_or_build_index, index_path_for
+from joke_client import connect, connect_timeout, default_socket_path, owned_by_current_user
+
+# --- configuration and constants ---
+# the wire protocol and the client live in joke_client.py
+max_request_bytes = 64 * 1024
+
+
+# --- server: loads the corpus once and shares it with every client ---
+class jokeserver:
+    def __init__(self, index, socket_path):
+        self.index, self.socket_path = index, socket_path
+        self.clients = set()
+
+    def handle_request(self, request):
+        """answers one decoded request from the shared index."""
+        op = request.get("op")
+        if op == "random": return {"joke": self.index.random_joke()}
+        if op == "about":
+            topic = request.get("topic")
+            if not isinstance(topic, str): return {"error": "malformed request: 'about' needs a topic string"}
+            return {"joke": self.index.joke_about(topic)}
+        if op == "ping": return {"jokes": len(self.index.jokes)}
+        return {"error": f"unknown op '{op}'"}
+
+    async def handle_client(self, reader, writer):
+        self.clients.add(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line: break
+                try:
+                    reply = self.handle_request(json.loads(line))
+                except (ValueError, AttributeError):
+                    reply = {"error": "malformed request"}
+                writer.write(json.dumps(reply).encode('utf-8') + b'\n')
+                await writer.drain()
+        except (ConnectionError, ValueError):
+            pass  # client went away or sent an oversized line
+        finally:
+            self.clients.discard(writer); writer.close()
+
+    async def serve_forever(self):
+        server = await asyncio.start_unix_server(self.handle_client, path=self.socket_path, limit=max_request_bytes)
+        os.chmod(self.socket_path, 0o600)
+        # a plain kill stops the server cleanly so the socket file is still removed
+        stopped = asyncio.get_running_loop().create_future()
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stopped.set_result, None)
+        async with server:
+            await stopped
+            # hang up on connected clients so their handlers finish before the loop shuts down
+            for writer in list(self.clients): writer.close()
+            await asyncio.sleep(0)
+
+
+def _prepare_socket_dir(socket_path):
+    """creates the socket's directory (0700) if needed; returns why it is unsafe to use, or None."""
+    socket_dir = os.path.dirname(os.path.abspath(socket_path))
+    os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+    info = os.stat(socket_dir)
+    if hasattr(os, 'getuid') and info.st_uid != os.getuid(): return f"{socket_dir} belongs to another user"
+    # a shared directory is only acceptable with the sticky bit, which stops others replacing our socket
+    if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH) and not info.st_mode & stat.S_ISVTX:
+        return f"{socket_dir} is writable by other users"
+    return None
+
+def _is_stale_socket(socket_path):
+    """true only for our own socket file that nobody is listening on, e.g. one left behind by a crashed server."""
+    try:
+        if not stat.S_ISSOCK(os.stat(socket_path).st_mode): return False
+    except FileNotFoundError:
+        return False
+    if not owned_by_current_user(socket_path): return False
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    probe.settimeout(connect_timeout)
+    try:
+        probe.connect(socket_path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+    return False
+
+def run_server(joke_file_path, socket_path):
+    unsafe = _prepare_socket_dir(socket_path)
+    if unsafe:
+        print(f"refusing to start: {unsafe}"); return 1
+    client = connect(socket_path)
+    if client is not None:
+        client.close()
+        print(f"a joke service is already running on {socket_path}"); return 1
+    if _is_stale_socket(socket_path): os.unlink(socket_path)
+    elif os.path.exists(socket_path):
+        print(f"refusing to start: {socket_path} exists and is not a stale joke service socket of this user"); return 1
+
+    with open(joke_file_path, 'r') as f: index = load_or_build_index(f.read(), index_path_for(joke_file_path))
+    print(f"serving {len(index.jokes)} jokes ({index.duplicates_dropped} duplicates dropped) on {socket_path}")
+    try:
+        asyncio.run(jokeserver(index, socket_path).serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if os.path.exists(socket_path): os.unlink(socket_path)
+    return 0
+
+
+if __name__ == '__main__':
+    script_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+    parser = argparse.ArgumentParser(description="share one parsed joke corpus with every joke assistant window on this host.")
+    parser.add_argument("--jokes", default=os.path.join(script_dir, "randomJokes.txt"), help="joke file to serve")
+    parser.add_argument("--socket", default=default_socket_path(), help="unix socket path to listen on")
+    args = parser.parse_args()
+    sys.exit(run_server(args.jokes, args.socket))
@@ -0,0 +1,97 @@
+import hashlib, json, os, sys, tempfile, unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import joke_index
+
+# --- duplicate detection ---
+class findduplicatestests(unittest.TestCase):
+    def test_exact_duplicates_ignore_case_and_whitespace(self):
+        jokes = [("Why did the chicken cross the road", "To get to the other side."),
+                 ("why  did the CHICKEN cross the road", " to get to the other   side.")]
+        self.assertEqual(joke_index.find_duplicates(jokes), {1: 0})
+
+    def test_stop_word_only_jokes_do_not_collide(self):
+        jokes = [("What is it", "It is"), ("Who is he", "he is")]
+        self.assertEqual(joke_index.find_duplicates(jokes), {})
+
+    def test_near_duplicate_above_threshold(self):
+        # 9 shared content tokens out of 10 distinct: jaccard 0.9
+        jokes = [("alpha bravo charlie delta echo", "foxtrot golf hotel india"),
+                 ("alpha bravo charlie delta echo", "foxtrot golf hotel india juliet")]
+        self.assertEqual(joke_index.find_duplicates(jokes), {1: 0})
+
+    def test_similar_jokes_below_threshold_are_kept(self):
+        # 3 shared content tokens out of 5 distinct: jaccard 0.6
+        jokes = [("alpha bravo charlie", "delta"), ("alpha bravo charlie", "echo")]
+        self.assertEqual(joke_index.find_duplicates(jokes), {})
+
+    def test_build_drops_duplicates_from_corpus(self):
+        index = joke_index.jokeindex.build([("pizza joke", "too cheesy"), ("Pizza joke", "Too cheesy"), ("owl", "hoo")])
+        self.assertEqual(index.jokes, [("pizza joke", "too cheesy"), ("owl", "hoo")])
+        self.assertEqual(index.duplicates_dropped, 1)
+
+
+# --- search ---
+class searchtests(unittest.TestCase):
+    def setUp(self):
+        self.index = joke_index.jokeindex.build([
+            ("Why did the chicken cross the road", "To get to the other side."),
+            ("Want to hear a pizza joke", "Never mind, it's too cheesy."),
+            ("Why did the chicken eat pizza", "It was hungry."),
+        ])
+
+    def test_all_terms_are_intersected(self):
+        self.assertEqual(self.index.search("chicken pizza"), [2])
+
+    def test_plurals_and_stop_words_are_normalised(self):
+        self.assertEqual(self.index.search("about the chickens"), [0, 2])
+
+    def test_falls_back_to_best_partial_matches(self):
+        self.assertEqual(self.index.search("road pizza"), [0, 1, 2])
+        self.assertEqual(self.index.search("cheesy road zebra"), [0, 1])
+
+    def test_no_match(self):
+        self.assertEqual(self.index.search("zebra"), [])
+        self.assertEqual(self.index.search("the"), [])
+        self.assertIsNone(self.index.joke_about("zebra"))
+
+
+# --- disk cache ---
+class cachetests(unittest.TestCase):
+    content = "Why did the chicken cross the road?To get to the other side.\nWhat do you call a fish with no eyes?A fsh."
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory(); self.addCleanup(self.temp_dir.cleanup)
+        self.cache_path = os.path.join(self.temp_dir.name, "randomJokes.txt" + joke_index.index_suffix)
+        self.digest = hashlib.sha1(self.content.encode('utf-8')).hexdigest()
+
+    def _write_cache(self, data):
+        with open(self.cache_path, 'w') as f: f.write(data if isinstance(data, str) else json.dumps(data))
+
+    def test_save_then_load_round_trip(self):
+        built = joke_index.load_or_build_index(self.content, self.cache_path)
+        self.assertEqual(os.listdir(self.temp_dir.name), [os.path.basename(self.cache_path)])
+        loaded = joke_index.jokeindex.load(self.cache_path, self.digest)
+        self.assertEqual(loaded.jokes, built.jokes); self.assertEqual(loaded.postings, built.postings)
+
+    def test_stale_cache_is_rebuilt(self):
+        self._write_cache({"version": joke_index.index_version, "source": "old digest",
+                           "jokes": [["stale", "joke"]], "postings": {"stale": [0]}})
+        index = joke_index.load_or_build_index(self.content, self.cache_path)
+        self.assertEqual(len(index.jokes), 2)
+        self.assertIsNotNone(joke_index.jokeindex.load(self.cache_path, self.digest))
+
+    def test_corrupt_caches_are_rebuilt(self):
+        good = {"version": joke_index.index_version, "source": self.digest, "jokes": [["a", "b"]], "postings": {"a": [0]}}
+        corrupt = ["{not json", "[1, 2]", {"version": joke_index.index_version, "source": self.digest},
+                   dict(good, jokes=["ab"]), dict(good, jokes=[["a", "b", "c"]]), dict(good, jokes=[["a", 1]]),
+                   dict(good, postings={"a": 0}), dict(good, postings={"a": ["0"]}), dict(good, postings={"a": [5]}),
+                   dict(good, duplicates_dropped="0")]
+        for data in corrupt:
+            with self.subTest(data=data):
+                self._write_cache(data)
+                self.assertIsNone(joke_index.jokeindex.load(self.cache_path, self.digest))
+                self.assertEqual(len(joke_index.load_or_build_index(self.content, self.cache_path).jokes), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import json, os, signal, socket, subprocess, sys, tempfile, time, unittest
+from unittest import mock
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+import joke_client
+import joke_index
+import joke_service
+
+jokes_text = "Why did the chicken cross the road?To get to the other side.\nWant to hear a pizza joke?Never mind, it's too cheesy."
+
+# --- helpers: a real server in a subprocess on a temporary socket ---
+class servertestcase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory(); self.addCleanup(self.temp_dir.cleanup)
+        self.jokes_path = os.path.join(self.temp_dir.name, "randomJokes.txt")
+        with open(self.jokes_path, 'w') as f: f.write(jokes_text)
+        self.socket_path = os.path.join(self.temp_dir.name, "joke.sock")
+
+    def start_server(self):
+        server = subprocess.Popen([sys.executable, os.path.join(script_dir, "joke_service.py"), "--jokes", self.jokes_path,
+                                   "--socket", self.socket_path], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        self.addCleanup(self.stop_server, server)
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            client = joke_client.connect(self.socket_path)
+            if client is not None:
+                self.addCleanup(client.close); return server, client
+            if server.poll() is not None: self.fail(f"server exited: {server.stderr.read().decode()}")
+            time.sleep(0.05)
+        self.fail("server did not start")
+
+    def stop_server(self, server):
+        if server.poll() is None: server.send_signal(signal.SIGTERM)
+        server.wait(timeout=5); server.stderr.close()
+
+    def raw_connection(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM); sock.settimeout(5)
+        sock.connect(self.socket_path); self.addCleanup(sock.close)
+        return sock, sock.makefile('rb')
+
+    def raw_request(self, sock, reader, line):
+        sock.sendall(line + b'\n')
+        return json.loads(reader.readline())
+
+
+# --- protocol ---
+class protocoltests(servertestcase):
+    def test_random_about_and_ping(self):
+        _, client = self.start_server()
+        self.assertIn(client.random_joke(), [tuple(line.split('?', 1)) for line in jokes_text.split('\n')])
+        self.assertEqual(client.joke_about("pizza"), ("Want to hear a pizza joke", "Never mind, it's too cheesy."))
+        self.assertIsNone(client.joke_about("zebra"))
+        self.assertEqual(client._request(op="ping"), {"jokes": 2})
+
+    def test_bad_requests_get_errors_and_keep_the_connection(self):
+        self.start_server()
+        sock, reader = self.raw_connection()
+        for line in [b'not json', b'[1, 2]', b'{"op": "dance"}', b'{"op": "about"}', b'{"op": "about", "topic": null}']:
+            with self.subTest(line=line):
+                self.assertIn("error", self.raw_request(sock, reader, line))
+        self.assertEqual(self.raw_request(sock, reader, b'{"op": "ping"}'), {"jokes": 2})
+
+    def test_oversized_line_closes_the_connection(self):
+        self.start_server()
+        sock, reader = self.raw_connection()
+        try:
+            sock.sendall(b'x' * (joke_service.max_request_bytes * 2) + b'\n')
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        self.assertEqual(reader.readline(), b'')
+        self.assertIsNotNone(joke_client.connect(self.socket_path))  # the server itself keeps serving
+
+    def test_client_rejects_socket_of_another_user(self):
+        self.start_server()
+        with mock.patch.object(os, 'getuid', return_value=os.getuid() + 1):
+            self.assertIsNone(joke_client.connect(self.socket_path))
+
+
+# --- stale socket handling ---
+class stalesockettests(servertestcase):
+    def test_leftover_socket_is_stale_and_replaced(self):
+        leftover = socket.socket(socket.AF_UNIX); leftover.bind(self.socket_path); leftover.close()
+        self.assertTrue(joke_service._is_stale_socket(self.socket_path))
+        _, client = self.start_server()
+        self.assertEqual(client._request(op="ping"), {"jokes": 2})
+
+    def test_live_socket_of_another_program_is_left_alone(self):
+        other = socket.socket(socket.AF_UNIX); other.bind(self.socket_path); other.listen(); self.addCleanup(other.close)
+        self.assertFalse(joke_service._is_stale_socket(self.socket_path))
+        with mock.patch('builtins.print'):
+            self.assertEqual(joke_service.run_server(self.jokes_path, self.socket_path), 1)
+        self.assertTrue(os.path.exists(self.socket_path))
+
+    def test_non_sockets_and_missing_paths_are_not_stale(self):
+        self.assertFalse(joke_service._is_stale_socket(self.socket_path))
+        with open(self.socket_path, 'w'): pass
+        self.assertFalse(joke_service._is_stale_socket(self.socket_path))
+
+
+# --- client fallback in the gui ---
+class fallbacktests(servertestcase):
+    def test_app_falls_back_to_local_index_when_service_dies(self):
+        import joke_assistant
+        server, client = self.start_server()
+        app = object.__new__(joke_assistant.jokeassistantapp)
+        app.source = client
+        self.assertEqual(app.fetch_joke("chicken")[0], "Why did the chicken cross the road")
+
+        self.stop_server(server)
+        with mock.patch.object(joke_assistant, 'read_joke_file', return_value=(jokes_text, None)):
+            self.assertEqual(app.fetch_joke("pizza")[0], "Want to hear a pizza joke")
+        self.assertIsInstance(app.source, joke_index.jokeindex)
+        self.assertTrue(client.reader.closed); self.assertEqual(client.sock.fileno(), -1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import os, statistics, subprocess, sys, time
+
+# --- startup benchmark: headless model vs eager tkinter ---
+# each scenario runs in a fresh interpreter so import caches don't hide the cost.
+script_dir = os.path.dirname(os.path.abspath(__file__))
+runs = 15
+
+scenarios = [
+    ("model only (student_model)", "import student_model; student_model.datamanager()"),
+    ("gui module, tk not started", "import student_data_tools; student_data_tools.datamanager()"),
+    ("gui module + tkinter import (old startup)", "import tkinter, tkinter.messagebox, student_data_tools; student_data_tools.datamanager()"),
+]
+# creating a real tk root needs a display, so only measure it when one is available
+if os.environ.get('DISPLAY') or sys.platform in ('win32', 'darwin'):
+    scenarios.append(("gui module + tk root (old startup)",
+                      "import tkinter, student_data_tools; r = tkinter.Tk(); student_data_tools.datamanager(); r.destroy()"))
+
+def time_scenario(code):
+    """returns the median wall-clock time in ms of running code in a new interpreter."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=script_dir, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+if __name__ == '__main__':
+    baseline = time_scenario("pass")
+    print(f"{'scenario':<45}{'median ms':>10}{'over bare python':>18}")
+    print("=" * 73)
+    for name, code in scenarios:
+        elapsed = time_scenario(code)
+        print(f"{name:<45}{elapsed:>10.1f}{elapsed - baseline:>18.1f}")
@@ -1,10 +1,16 @@
-import tkinter as tk
-from tkinter import messagebox, ttk
-import os, sys
+from student_model import data_file, max_coursework, max_exam, max_total, create_initial_file, student, datamanager
 
-# --- configuration and constants ---
-data_file, max_coursework, max_exam = "studentMarks.txt", 60, 100
-max_total = max_coursework + max_exam
+# tkinter is only imported once the gui is actually started, so the student model
+# can be imported (and tested) headless without paying for tk initialisation
+tk = messagebox = None
+
+def _load_tk():
+    """imports tkinter on first use and binds it to the module-level names used by the gui."""
+    global tk, messagebox
+    if tk is None:
+        import tkinter as tk
+        from tkinter import messagebox
+    return tk
 
 # --- custom styling (modern slate theme) ---
 theme = {
@@ -20,96 +26,10 @@ theme = {
     'font_size_menu': 12,
 }
 
-# --- utility functions ---
-def _get_app_file_path():
-    """determines the absolute path of the data file."""
-    if getattr(sys, 'frozen', False): script_dir = os.path.dirname(sys.executable)
-    else: script_dir = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(script_dir, data_file)
-
-def create_initial_file():
-    """creates the studentMarks.txt file if it doesn't exist."""
-    file_path = _get_app_file_path()
-    if not os.path.exists(file_path):
-        initial_data = """10
-1345,John Curry,8,15,7,45
-2345,Sam Sturtivant,14,15,14,77
-9876,Lee Scott,17,11,16,99
-3724,Matt Thompson,19,11,15,81
-1212,Ron Herrema,14,17,18,66
-8439,Jake Hobbs,10,11,10,43
-2344,Jo Hyde,6,15,10,55
-9384,Gareth Southgate,5,6,8,33
-8327,Alan Shearer,20,20,20,100
-2983,Les Ferdinand,15,17,18,92
-"""
-        try:
-            with open(file_path, 'w') as f: f.write(initial_data)
-        except Exception as e:
-            messagebox.showerror("initial file creation error", f"could not create data file: {e}")
-
-
-# --- 1. data model: student class ---
-class student:
-    def __init__(self, code, name, c1, c2, c3, exam):
-        self.code, self.name = str(code), name
-        self.c1, self.c2, self.c3, self.exam = int(c1), int(c2), int(c3), int(exam)
-        self.coursework_total = self.c1 + self.c2 + self.c3
-        self.overall_total = self.coursework_total + self.exam
-        
-    def calculate_percentage(self):
-        """calculates overall percentage out of 160."""
-        return round((self.overall_total / max_total) * 100, 2)
-
-    def calculate_grade(self):
-        """assigns a grade based on overall percentage."""
-        percent = self.calculate_percentage()
-        if percent >= 70: return 'a'
-        if percent >= 60: return 'b'
-        if percent >= 50: return 'c'
-        if percent >= 40: return 'd'
-        return 'f'
-
-    def get_details(self):
-        """returns a formatted dictionary of all calculated results."""
-        return {"name": self.name, "code": self.code, "coursework_total": self.coursework_total,
-                "exam_mark": self.exam, "overall_total": self.overall_total,
-                "percentage": self.calculate_percentage(), "grade": self.calculate_grade().upper()}
-
-# --- 2. data management and persistence ---
-class datamanager:
-    def __init__(self):
-        self.students = []; self.load_data()
-        
-    def load_data(self):
-        self.students = []
-        try:
-            with open(_get_app_file_path(), 'r') as f: lines = f.readlines()
-            if not lines: return
-            for line in lines[1:]:
-                parts = line.strip().split(',')
-                if len(parts) == 6:
-                    self.students.append(student(code=parts[0], name=parts[1],
-                                c1=parts[2], c2=parts[3], c3=parts[4], exam=parts[5]))
-        except FileNotFoundError:
-            pass 
-        except Exception as e:
-            messagebox.showerror("error", f"data loading error: {e}")
-
-    def save_data(self):
-        try:
-            with open(_get_app_file_path(), 'w') as f:
-                f.write(f"{len(self.students)}\n")
-                for s in self.students:
-                    f.write(f"{s.code},{s.name},{s.c1},{s.c2},{s.c3},{s.exam}\n")
-            return True
-        except Exception as e:
-            messagebox.showerror("save error", f"failed to save data to file: {e}")
-            return False
-
 # --- 3. tkinter gui application ---
 class studentmanagerapp:
     def __init__(self, master):
+        _load_tk()
         self.manager = datamanager(); self.master = master
         master.title("student records manager"); master.geometry("800x600")
         master.configure(bg=theme['background'])
@@ -128,6 +48,16 @@ class studentmanagerapp:
         
         # force update to ensure initial rendering is correct
         self.master.update_idletasks() 
+        self._report_errors()
+
+    def _report_errors(self):
+        """shows any errors the data manager queued as dialogs."""
+        for title, message in self.manager.pop_errors(): messagebox.showerror(title, message)
+
+    def _save(self):
+        """saves through the data manager and reports a failure to the user."""
+        if self.manager.save_data(): return True
+        self._report_errors(); return False
 
     def _clear_display(self):
         for widget in self.display_frame.winfo_children(): widget.destroy()
@@ -265,7 +195,7 @@ class studentmanagerapp:
             if any(s.code == code for s in self.manager.students): messagebox.showwarning("validation error", "student code already exists."); return
 
             self.manager.students.append(student(code, name, c1, c2, c3, exam))
-            if self.manager.save_data():
+            if self._save():
                 messagebox.showinfo("success", f"student '{name}' added successfully."); self.view_all_records()
         except ValueError as e:
             messagebox.showwarning("validation error", f"invalid input: {e}")
@@ -287,7 +217,7 @@ class studentmanagerapp:
         self.manager.students = [s for s in self.manager.students if s.code != query and s.name.lower() != query]
         
         if len(self.manager.students) < initial_count:
-            if self.manager.save_data():
+            if self._save():
                 messagebox.showinfo("success", f"student record matching '{query}' deleted successfully."); self.view_all_records()
         else:
             messagebox.showinfo("not found", f"no student found matching '{query}'. deletion failed.")
@@ -339,7 +269,7 @@ class studentmanagerapp:
             index = next(i for i, s in enumerate(self.manager.students) if s.code == student_obj.code)
             self.manager.students[index] = student(student_obj.code, new_name, new_c1, new_c2, new_c3, new_exam)
 
-            if self.manager.save_data():
+            if self._save():
                 messagebox.showinfo("success", f"student '{student_obj.code}' updated successfully."); self.view_all_records()
         
         except ValueError as e:
@@ -348,7 +278,8 @@ class studentmanagerapp:
             messagebox.showerror("error", f"an unknown error occurred: {e}")
 
 if __name__ == '__main__':
-    create_initial_file()
-    root = tk.Tk()
+    creation_error = create_initial_file()
+    root = _load_tk().Tk()
+    if creation_error: messagebox.showerror(*creation_error)
     app = studentmanagerapp(root)
     root.mainloop()
\ No newline at end of file
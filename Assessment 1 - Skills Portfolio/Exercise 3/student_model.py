@@ -0,0 +1,101 @@
+import os, sys
+
+# --- configuration and constants ---
+data_file, max_coursework, max_exam = "studentMarks.txt", 60, 100
+max_total = max_coursework + max_exam
+
+# --- utility functions ---
+def _get_app_file_path():
+    """determines the absolute path of the data file."""
+    if getattr(sys, 'frozen', False): script_dir = os.path.dirname(sys.executable)
+    else: script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(script_dir, data_file)
+
+def create_initial_file():
+    """creates the studentMarks.txt file if it doesn't exist; returns a (title, message) error or None."""
+    file_path = _get_app_file_path()
+    if not os.path.exists(file_path):
+        initial_data = """10
+1345,John Curry,8,15,7,45
+2345,Sam Sturtivant,14,15,14,77
+9876,Lee Scott,17,11,16,99
+3724,Matt Thompson,19,11,15,81
+1212,Ron Herrema,14,17,18,66
+8439,Jake Hobbs,10,11,10,43
+2344,Jo Hyde,6,15,10,55
+9384,Gareth Southgate,5,6,8,33
+8327,Alan Shearer,20,20,20,100
+2983,Les Ferdinand,15,17,18,92
+"""
+        try:
+            with open(file_path, 'w') as f: f.write(initial_data)
+        except Exception as e:
+            return ("initial file creation error", f"could not create data file: {e}")
+    return None
+
+
+# --- 1. data model: student class ---
+class student:
+    def __init__(self, code, name, c1, c2, c3, exam):
+        self.code, self.name = str(code), name
+        self.c1, self.c2, self.c3, self.exam = int(c1), int(c2), int(c3), int(exam)
+        self.coursework_total = self.c1 + self.c2 + self.c3
+        self.overall_total = self.coursework_total + self.exam
+
+    def calculate_percentage(self):
+        """calculates overall percentage out of 160."""
+        return round((self.overall_total / max_total) * 100, 2)
+
+    def calculate_grade(self):
+        """assigns a grade based on overall percentage."""
+        percent = self.calculate_percentage()
+        if percent >= 70: return 'a'
+        if percent >= 60: return 'b'
+        if percent >= 50: return 'c'
+        if percent >= 40: return 'd'
+        return 'f'
+
+    def get_details(self):
+        """returns a formatted dictionary of all calculated results."""
+        return {"name": self.name, "code": self.code, "coursework_total": self.coursework_total,
+                "exam_mark": self.exam, "overall_total": self.overall_total,
+                "percentage": self.calculate_percentage(), "grade": self.calculate_grade().upper()}
+
+# --- 2. data management and persistence ---
+class datamanager:
+    """loads and saves student records; failures are queued in self.errors as (title, message) pairs."""
+    def __init__(self):
+        self.students = []; self.errors = []; self.load_data()
+
+    def pop_errors(self):
+        """returns and clears the queued (title, message) errors for the caller to report."""
+        errors, self.errors = self.errors, []
+        return errors
+
+    def load_data(self):
+        self.students = []
+        try:
+            with open(_get_app_file_path(), 'r') as f: lines = f.readlines()
+            if not lines: return True
+            for line in lines[1:]:
+                parts = line.strip().split(',')
+                if len(parts) == 6:
+                    self.students.append(student(code=parts[0], name=parts[1],
+                                c1=parts[2], c2=parts[3], c3=parts[4], exam=parts[5]))
+            return True
+        except FileNotFoundError:
+            return True
+        except Exception as e:
+            self.errors.append(("error", f"data loading error: {e}"))
+            return False
+
+    def save_data(self):
+        try:
+            with open(_get_app_file_path(), 'w') as f:
+                f.write(f"{len(self.students)}\n")
+                for s in self.students:
+                    f.write(f"{s.code},{s.name},{s.c1},{s.c2},{s.c3},{s.exam}\n")
+            return True
+        except Exception as e:
+            self.errors.append(("save error", f"failed to save data to file: {e}"))
+            return False
@@ -0,0 +1,54 @@
+import os, subprocess, sys, tempfile, unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import student_model
+import student_data_tools
+
+# --- headless tests: nothing here needs a display or tkinter ---
+class datamanagertests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_path = os.path.join(self.temp_dir.name, student_model.data_file)
+        with open(self.data_path, 'w') as f: f.write("1\n1345,John Curry,8,15,7,45\n")
+        patcher = mock.patch.object(student_model, '_get_app_file_path', lambda: self.data_path)
+        patcher.start(); self.addCleanup(patcher.stop); self.addCleanup(self.temp_dir.cleanup)
+
+    def test_save_data_writes_records(self):
+        manager = student_model.datamanager()
+        manager.students.append(student_model.student(2345, "Sam Sturtivant", 14, 15, 14, 77))
+        self.assertTrue(manager.save_data())
+        self.assertEqual(manager.pop_errors(), [])
+        with open(self.data_path) as f: lines = f.read().splitlines()
+        self.assertEqual(lines, ["2", "1345,John Curry,8,15,7,45", "2345,Sam Sturtivant,14,15,14,77"])
+
+    def test_save_failure_is_queued_not_shown(self):
+        manager = student_model.datamanager()
+        self.data_path = self.temp_dir.name  # a directory cannot be opened for writing
+        self.assertFalse(manager.save_data())
+        errors = manager.pop_errors()
+        self.assertEqual(len(errors), 1); self.assertEqual(errors[0][0], "save error")
+        self.assertEqual(manager.pop_errors(), [])
+
+    def test_import_does_not_load_tkinter(self):
+        # a fresh interpreter, since this test process may already have tkinter loaded
+        code = "import sys, student_data_tools; print('tkinter' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "False")
+
+    def test_app_save_writes_file_and_reports_failure(self):
+        app = object.__new__(student_data_tools.studentmanagerapp)
+        app.manager = student_model.datamanager()
+        app.manager.students.pop()
+        self.assertTrue(app._save())
+        with open(self.data_path) as f: self.assertEqual(f.read(), "0\n")
+
+        self.data_path = self.temp_dir.name
+        with mock.patch.object(student_data_tools, 'messagebox') as fake_messagebox:
+            self.assertFalse(app._save())
+        fake_messagebox.showerror.assert_called_once()
+        self.assertEqual(fake_messagebox.showerror.call_args[0][0], "save error")
+
+if __name__ == '__main__':
+    unittest.main()